@@ -6,7 +6,9 @@ from .figure import Figure
 from .axis import Axis
 from .plot import SimpleTeX
 from .plot import PlotBase, PlotCoordinates, PlotScatter, Plot3DConst
-from .coordinates import Coordinates
+from .plot import PlotErrorBars, PlotBand
+from .coordinates import Coordinates, ErrorCoordinates, BandCoordinates
+from .cost import Cost, Budget
 from .util import note_pdf_encode
 
 __all__ = [
@@ -14,6 +16,8 @@ __all__ = [
     'Figure',
     'Axis',
     'SimpleTeX', 'PlotBase', 'PlotCoordinates', 'PlotScatter', 'Plot3DConst',
-    'Coordinates',
+    'PlotErrorBars', 'PlotBand',
+    'Coordinates', 'ErrorCoordinates', 'BandCoordinates',
+    'Cost', 'Budget',
     'note_pdf_encode',
     ]
@@ -1,5 +1,6 @@
 from .util import _OptionsDict
 from .plot import PlotBase
+from . import cost
 
 
 class Axis(object):
@@ -18,8 +19,27 @@ class Axis(object):
             raise TypeError("plot argument has wrong type")
         self.plots.append(plot)
 
+    def estimate_cost(self):
+        "Estimate the TeX resources (a cost.Cost) needed for this axis."
+        overhead = cost.Cost(cost.AXIS_OVERHEAD_MEMORY,
+                             compile_time=cost.AXIS_OVERHEAD_TIME)
+        return sum((plot.estimate_cost() for plot in self.plots), overhead)
+
+    def plan_budget(self, budget):
+        """Choose the output strategy (inline coordinates, inline table or
+        decimated data) of each plot so that the axis fits the given
+        cost.Budget. The plots are not changed. Returns the resulting cost
+        estimate and the plan, a dict mapping plots to (strategy, decimation)
+        tuples; assign these to a plot's attributes to keep them."""
+        overhead = cost.Cost(cost.AXIS_OVERHEAD_MEMORY,
+                             compile_time=cost.AXIS_OVERHEAD_TIME)
+        return cost.select_strategies(self.plots, budget, overhead)
+
     def __str__(self):
-        plots_tex = "\n".join([str(plot) for plot in self.plots])
+        return self._tex({})
+
+    def _tex(self, plan):
+        plots_tex = "\n".join([plot._tex(plan) for plot in self.plots])
         tex = r"""
 \begin{{axis}}[{options}]
 {texcode}
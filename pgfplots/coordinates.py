@@ -2,7 +2,36 @@ import itertools
 import collections
 
 
-class Coordinates(object):
+class _CoordinatesBase(object):
+    """Base class for the data of a plot. Subclasses provide the x attribute,
+    _map (a copy with a function applied to each data sequence), _rows (the
+    values of each table row) and __str__ (the coordinates syntax)."""
+    def __len__(self):
+        return self.count(1)
+
+    def count(self, step):
+        "Return the number of points written after decimate(step)."
+        return _every_count(len(self.x), step)
+
+    def decimate(self, step):
+        """Return a new instance containing only every step-th point."""
+        if step == 1:
+            return self
+        return self._map(lambda seq: _every(seq, step))
+
+    def table_options(self):
+        "Options for an addplot table command reading the output of table_str."
+        return "header=false"
+
+    def table_str(self):
+        """Return the coordinates as inline table data with one point per
+        line. Unlike the coordinates syntax this keeps the input lines short
+        enough for TeX's buffer."""
+        rows = (" ".join([str(e) for e in row]) for row in self._rows())
+        return "{\n"+"\n".join(rows)+"\n}"
+
+
+class Coordinates(_CoordinatesBase):
     """Class describing PGFPlots \addplot* coordinates to be included in a
     plotting command."""
     def __init__(self, x, y, z=None, values=None):
@@ -11,6 +40,8 @@ class Coordinates(object):
         values argument describes PGFPlots point meta values."""
         self.x = x
         self.y = y
+        self._has_z = z is not None
+        self._has_values = values is not None
         if not isinstance(z, collections.Iterable):
             z = len(self.x)*[z]
         self.z = z
@@ -18,9 +49,145 @@ class Coordinates(object):
             values = len(self.x)*[values]
         self.values = values
 
+    def _map(self, func):
+        return Coordinates(func(self.x), func(self.y),
+                           func(self.z) if self._has_z else None,
+                           func(self.values) if self._has_values else None)
+
+    def table_options(self):
+        options = _CoordinatesBase.table_options(self)
+        if self._has_values:
+            options += ",meta index={}".format(3 if self._has_z else 2)
+        return options
+
+    def _rows(self):
+        columns = [self.x, self.y]
+        if self._has_z:
+            columns.append(self.z)
+        if self._has_values:
+            columns.append(self.values)
+        return itertools.izip(*columns)
+
     def __str__(self):
         c_iter = itertools.izip(self.x, self.y, self.z, self.values)
         c_strs = ("({coordinate}) [{value}]".format(
             coordinate=",".join([str(e) for e in c[:3] if e is not None]),
             value=c[3]) for c in c_iter)
         return "{"+" ".join(c_strs)+"}"
+
+
+class ErrorCoordinates(_CoordinatesBase):
+    """Coordinates with explicit error bars, written in the "(x,y) +- (dx,dy)"
+    syntax."""
+    def __init__(self, x, y, x_error=None, y_error=None):
+        """Initialize an ErrorCoordinates instance. x_error and y_error are
+        sequences of (symmetric) errors or a single error applying to all
+        points. A missing error is written as zero."""
+        for error in (x_error, y_error):
+            if (isinstance(error, collections.Iterable) and
+                    len(error) != len(x)):
+                raise ValueError("errors need to have the same length as x")
+        self.x = x
+        self.y = y
+        self.x_error = x_error
+        self.y_error = y_error
+        self.has_x_error = x_error is not None
+        self.has_y_error = y_error is not None
+
+    def _map(self, func):
+        return ErrorCoordinates(func(self.x), func(self.y),
+                                func(self.x_error), func(self.y_error))
+
+    def table_options(self):
+        options = [_CoordinatesBase.table_options(self)]
+        index = 2
+        if self.has_x_error:
+            options.append("x error index={}".format(index))
+            index += 1
+        if self.has_y_error:
+            options.append("y error index={}".format(index))
+        return ",".join(options)
+
+    def _rows(self):
+        columns = [self.x, self.y]
+        if self.has_x_error:
+            columns.append(_broadcast(self.x_error))
+        if self.has_y_error:
+            columns.append(_broadcast(self.y_error))
+        return itertools.izip(*columns)
+
+    def __str__(self):
+        c_strs = itertools.starmap(
+            "({},{}) +- ({},{})".format,
+            itertools.izip(self.x, self.y, _broadcast(self.x_error),
+                           _broadcast(self.y_error)))
+        return "{"+" ".join(c_strs)+"}"
+
+
+class BandCoordinates(_CoordinatesBase):
+    """Closed outline of the band between a lower and an upper curve: the
+    upper curve from left to right followed by the lower curve from right to
+    left. The outline is generated while writing, no joined copy of the data
+    is kept."""
+    def __init__(self, x, lower, upper):
+        """Initialize a BandCoordinates instance. x, lower and upper are
+        sequences of equal length which support reversed()."""
+        if len(lower) != len(x) or len(upper) != len(x):
+            raise ValueError("lower and upper need to have the same length "
+                             "as x")
+        self.x = x
+        self.lower = lower
+        self.upper = upper
+
+    def count(self, step):
+        return 2*_every_count(len(self.x), step, True)
+
+    def _rows(self):
+        return itertools.chain(
+            itertools.izip(self.x, self.upper),
+            itertools.izip(reversed(self.x), reversed(self.lower)))
+
+    def _map(self, func):
+        return BandCoordinates(func(self.x), func(self.lower),
+                               func(self.upper))
+
+    def decimate(self, step):
+        """Return a new BandCoordinates instance containing only every
+        step-th point. The last point is always kept so that the band keeps
+        its extent."""
+        if step == 1:
+            return self
+        return self._map(lambda seq: _every(seq, step, True))
+
+    def __str__(self):
+        c_strs = itertools.starmap("({},{})".format, self._rows())
+        return "{"+" ".join(c_strs)+"}"
+
+
+def _every(seq, step, keep_last=False):
+    """Return a list of every step-th element of seq, optionally followed by
+    its last element. Single values (and None) are returned unchanged."""
+    if not isinstance(seq, collections.Iterable):
+        return seq
+    result = list(itertools.islice(seq, 0, None, step))
+    if keep_last and len(seq) and (len(seq) - 1) % step:
+        result.append(seq[-1])
+    return result
+
+
+def _every_count(n, step, keep_last=False):
+    "Return the length of _every's result for a sequence of length n."
+    count = (n + step - 1)//step
+    if keep_last and n and (n - 1) % step:
+        count += 1
+    return count
+
+
+def _broadcast(value):
+    """Turn a single value (or None) into an endless sequence of this value,
+    sequences are returned unchanged."""
+    if value is None:
+        value = 0
+    if not isinstance(value, collections.Iterable):
+        value = itertools.repeat(value)
+    return value
@@ -0,0 +1,188 @@
+"""Rough model of the TeX resources needed to typeset PGFPlots output. The
+numbers are empirical estimates for pdflatex with the TeX Live default
+texmf.cnf settings and are meant to catch "TeX capacity exceeded" errors before
+compiling, not to predict exact figures."""
+import math
+
+# TeX Live defaults (texmf.cnf)
+DEFAULT_MAIN_MEMORY = 5000000
+DEFAULT_BUF_SIZE = 200000
+
+# Words of main memory and seconds per input character (token) and per
+# coordinate processed by PGFPlots.
+_MEMORY_PER_CHAR = 1
+_MEMORY_PER_POINT = 40
+_SECONDS_PER_CHAR = 2e-6
+_SECONDS_PER_POINT = 1e-4
+
+# Fixed costs of loading pgfplots and of setting up a single axis.
+DOCUMENT_OVERHEAD_MEMORY = 600000
+DOCUMENT_OVERHEAD_TIME = 1.0
+AXIS_OVERHEAD_MEMORY = 20000
+AXIS_OVERHEAD_TIME = 0.05
+
+
+class Cost(object):
+    """Estimated TeX resources: main_memory in words, buf_size in characters
+    (the longest input line) and compile_time in seconds. Add two Cost
+    instances for content that is held in memory at the same time (e.g. the
+    plots of one axis or the axes of one figure), use sequence() for content
+    typeset one after the other (the figures of a document, each of which is a
+    separate page)."""
+    def __init__(self, main_memory=0, buf_size=0, compile_time=0.0):
+        self.main_memory = main_memory
+        self.buf_size = buf_size
+        self.compile_time = compile_time
+
+    def __add__(self, other):
+        return Cost(self.main_memory + other.main_memory,
+                    max(self.buf_size, other.buf_size),
+                    self.compile_time + other.compile_time)
+
+    def fits(self, budget):
+        "Return True if this cost stays within the given Budget."
+        return (self.buf_size <= budget.buf_size and
+                not self.exceeds_size(budget))
+
+    def exceeds_size(self, budget):
+        """Return True if the main memory or the compile time exceed the given
+        Budget, i.e. if there are too many points rather than too long
+        lines."""
+        return (self.main_memory > budget.main_memory or
+                (budget.compile_time is not None and
+                 self.compile_time > budget.compile_time))
+
+    def __repr__(self):
+        return "Cost(main_memory={}, buf_size={}, compile_time={:.2f})".format(
+            self.main_memory, self.buf_size, self.compile_time)
+
+
+class Budget(object):
+    """Upper limits for the TeX resources of a document. main_memory and
+    buf_size default to the TeX Live defaults, a compile_time of None means no
+    time limit."""
+    def __init__(self, main_memory=DEFAULT_MAIN_MEMORY,
+                 buf_size=DEFAULT_BUF_SIZE, compile_time=None):
+        self.main_memory = main_memory
+        self.buf_size = buf_size
+        self.compile_time = compile_time
+
+    def share(self, time_fraction, memory_fraction=1.0):
+        """Return a budget for a part of the document that may take the given
+        fractions of the compile time and the main memory. Memory is only
+        freed after each page, i.e. after each figure, so the axes of a figure
+        need to split it while the figures of a document do not. The buffer
+        limit applies to each line and is never split."""
+        if self.compile_time is None:
+            compile_time = None
+        else:
+            compile_time = self.compile_time*time_fraction
+        return Budget(self.main_memory*memory_fraction, self.buf_size,
+                      compile_time)
+
+    def __repr__(self):
+        return "Budget(main_memory={}, buf_size={}, compile_time={})".format(
+            self.main_memory, self.buf_size, self.compile_time)
+
+
+def sequence(costs):
+    """Combine the costs of pages typeset one after the other: memory is freed
+    in between so only the peak counts, times add up."""
+    result = Cost()
+    for c in costs:
+        result = Cost(max(result.main_memory, c.main_memory),
+                      max(result.buf_size, c.buf_size),
+                      result.compile_time + c.compile_time)
+    return result
+
+
+def plan_shares(parts, budget, share_memory):
+    """Call plan_budget on each of parts with a share of the budget
+    proportional to its estimated cost. The compile time is always split, the
+    main memory only if share_memory is True. Returns the list of resulting
+    cost estimates and the combined plan."""
+    costs = [part.estimate_cost() for part in parts]
+    total_time = sum(c.compile_time for c in costs)
+    total_memory = sum(c.main_memory for c in costs)
+    results, plan = [], {}
+    for part, c in zip(parts, costs):
+        time_fraction = c.compile_time/total_time if total_time else 1.0
+        if share_memory and total_memory:
+            memory_fraction = float(c.main_memory)/total_memory
+        else:
+            memory_fraction = 1.0
+        part_cost, part_plan = part.plan_budget(
+            budget.share(time_fraction, memory_fraction))
+        results.append(part_cost)
+        plan.update(part_plan)
+    return results, plan
+
+
+def estimate(n_chars, buf_size, n_points=0):
+    """Estimate the cost of n_chars characters of LaTeX code with buf_size as
+    the longest line, which make PGFPlots process n_points coordinates."""
+    return Cost(n_chars*_MEMORY_PER_CHAR + n_points*_MEMORY_PER_POINT,
+                buf_size,
+                n_chars*_SECONDS_PER_CHAR + n_points*_SECONDS_PER_POINT)
+
+
+def estimate_tex(tex, n_points=0):
+    """Estimate the cost of the given LaTeX code which makes PGFPlots process
+    n_points coordinates."""
+    return estimate(len(tex), max(len(line) for line in tex.split("\n")),
+                    n_points)
+
+
+def select_strategies(plots, budget, overhead=Cost()):
+    """Choose the output strategy of the given plots (which are typeset in a
+    single axis) so that their cost plus the overhead fits the budget. Plots
+    are first written inline, plots with too long lines are written as tables
+    and if memory or compile time are still exceeded the largest plots are
+    decimated to a common maximum number of points. Only a strategy or
+    decimation of None is chosen, values set on a plot are kept. Plots are not
+    decimated if that cannot bring the axis within budget. Returns the
+    resulting cost estimate, which is over budget in this case, and the plan
+    (a dict mapping each plot to its (strategy, decimation) tuple)."""
+    plan = dict((p, p._choice()) for p in plots if hasattr(p, "_choice"))
+    fixed = sum((p.estimate_cost() for p in plots if p not in plan),
+                overhead)
+
+    for plot in plan:
+        if (plot.strategy is None and
+                plot.estimate_cost(*plan[plot]).buf_size > budget.buf_size):
+            plan[plot] = ("table", plan[plot][1])
+
+    def total():
+        return sum((p.estimate_cost(*plan[p]) for p in plan), fixed)
+
+    adjustable = [p for p in plan if p.decimation is None]
+
+    def decimate(limit):
+        for plot in adjustable:
+            n = len(plot.coordinates)
+            if n > limit:
+                decimation = int(math.ceil(float(n)/limit))
+            else:
+                decimation = 1
+            plan[plot] = (plan[plot][0], decimation)
+
+    cost = total()
+    if not cost.exceeds_size(budget):
+        return cost, plan
+
+    # Give up right away if even a single point per plot is too much.
+    decimate(1)
+    if total().exceeds_size(budget):
+        decimate(float("inf"))
+        return cost, plan
+
+    limit = max([len(p.coordinates) for p in adjustable] + [1])
+    while cost.exceeds_size(budget):
+        # Guess the point limit from the excess and lower it until it fits.
+        ratios = [float(cost.main_memory)/max(budget.main_memory, 1)]
+        if budget.compile_time is not None:
+            ratios.append(cost.compile_time/max(budget.compile_time, 1e-9))
+        limit = max(1, min(limit - 1, int(limit/max(ratios))))
+        decimate(limit)
+        cost = total()
+    return cost, plan
@@ -1,5 +1,8 @@
 from .util import _Packages, _OptionsDict
 from .figure import Figure
+from . import cost
+
+import warnings
 
 
 class Document(object):
@@ -7,12 +10,14 @@ class Document(object):
     figures call an instance's add_figure method. To get LaTeX code simply run
     str(document).
     """
-    def __init__(self, classoptions={}, packages={}):
+    def __init__(self, classoptions={}, packages={}, budget=None):
         """Initialize a new Document class instance. It is possible to specify
         options to the documentclass via the classoptions argument. Similarly,
         one can specify LaTeX packages to be loaded via the packages
         argument. Both are dict's with the key as the package name and the
-        values as options (no options are indicated by a None value."""
+        values as options (no options are indicated by a None value. If a
+        cost.Budget is given as the budget argument, plan_budget is used
+        whenever LaTeX code is produced."""
         self.figures = []
 
         # Load pgfplots and pdfcomment by default
@@ -24,14 +29,52 @@ class Document(object):
         self.classoptions = _OptionsDict(classoptions)
         self.classoptions['tikz'] = None
 
+        self.budget = budget
+
     def add_figure(self, fig):
         "Add a figure to the document."
         if not isinstance(fig, Figure):
             raise TypeError("fig needs to be of type plt.Figure")
         self.figures.append(fig)
 
+    def estimate_cost(self):
+        """Estimate the TeX resources (a cost.Cost) needed to compile this
+        document."""
+        overhead = cost.Cost(cost.DOCUMENT_OVERHEAD_MEMORY,
+                             compile_time=cost.DOCUMENT_OVERHEAD_TIME)
+        return overhead + cost.sequence([fig.estimate_cost()
+                                         for fig in self.figures])
+
+    def plan_budget(self, budget):
+        """Choose the output strategy of every plot in the document so that it
+        compiles within the given cost.Budget. Returns the resulting cost
+        estimate and the plan (see Axis.plan_budget); check the estimate with
+        its fits method since the budget cannot always be met. Plots are never
+        decimated if that does not help, e.g. if the fixed overhead of the
+        document alone exceeds the budget."""
+        overhead = cost.Cost(cost.DOCUMENT_OVERHEAD_MEMORY,
+                             compile_time=cost.DOCUMENT_OVERHEAD_TIME)
+        remaining = cost.Budget(
+            budget.main_memory - overhead.main_memory, budget.buf_size,
+            None if budget.compile_time is None
+            else budget.compile_time - overhead.compile_time)
+        costs, plan = cost.plan_shares(self.figures, remaining,
+                                       share_memory=False)
+        return overhead + cost.sequence(costs), plan
+
     def __str__(self):
-        figures_tex = "\n\n".join([str(fig)
+        plan = {}
+        if self.budget is not None:
+            estimate, plan = self.plan_budget(self.budget)
+            if not estimate.fits(self.budget):
+                warnings.warn("Estimated {} exceeds {}".format(estimate,
+                                                               self.budget))
+            decimated = [plot for plot, (_, decimation) in plan.items()
+                         if plot.decimation is None and decimation > 1]
+            if decimated:
+                warnings.warn("{} plot(s) decimated to fit {}".format(
+                    len(decimated), self.budget))
+        figures_tex = "\n\n".join([fig._tex(plan)
                                    for fig in self.figures])
         tex = r"""\documentclass[{classoptions}]{{standalone}}
 
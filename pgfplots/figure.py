@@ -1,5 +1,6 @@
 from .util import _OptionsDict, note_pdf_encode
 from .axis import Axis
+from . import cost
 
 
 class Figure(object):
@@ -21,8 +22,24 @@ class Figure(object):
             raise TypeError("axis argument needs to be of type pgfplots.Axis")
         self.axes.append(axis)
 
+    def estimate_cost(self):
+        """Estimate the TeX resources (a cost.Cost) needed for this figure. All
+        axes are kept in memory until the end of the tikzpicture, so their
+        costs add up."""
+        return sum((ax.estimate_cost() for ax in self.axes), cost.Cost())
+
+    def plan_budget(self, budget):
+        """Plan the given cost.Budget for all axes of the figure, splitting the
+        compile time and the main memory between them. Returns the resulting
+        cost estimate and the plan (see Axis.plan_budget)."""
+        costs, plan = cost.plan_shares(self.axes, budget, share_memory=True)
+        return sum(costs, cost.Cost()), plan
+
     def __str__(self):
-        axes_tex = "\n".join([str(ax) for ax in self.axes])
+        return self._tex({})
+
+    def _tex(self, plan):
+        axes_tex = "\n".join([ax._tex(plan) for ax in self.axes])
         if self.note is not None:
             note_tex = (
                 "\\pdfcomment[hoffset=-1000pt,subject=Me]{{{note}}}\n".format(
@@ -1,14 +1,108 @@
 from .util import _OptionsDict
-from .coordinates import Coordinates
+from .coordinates import Coordinates, ErrorCoordinates, BandCoordinates
+from . import cost
 
 import itertools
 
+# Approximate number of points written to extrapolate the output length of a
+# plot.
+_COST_SAMPLE_SIZE = 50
+
 
 class PlotBase(object):
     "Base class for axis elements - needs to be subclassed."
     def __init__(self):
         raise NotImplementedError
 
+    def estimate_cost(self):
+        "Estimate the TeX resources (a cost.Cost) needed for this element."
+        return cost.estimate_tex(str(self))
+
+    def _tex(self, plan):
+        """Return the LaTeX code of this element, written according to plan
+        (see _DataPlot)."""
+        return str(self)
+
+
+class _DataPlot(PlotBase):
+    """Base class for plots of Coordinates. The strategy attribute selects
+    whether the data is written as inline "coordinates" or as inline "table"
+    data with one point per line, the decimation attribute keeps only every
+    n-th point. None leaves the choice to budgets (see Document.plan_budget)
+    and otherwise means inline and all points. Budgets compute a plan, a dict
+    mapping plots to (strategy, decimation) tuples, which is only used while
+    writing and never changes the plots. Tables are kept inline rather than
+    written to external files so that str() stays free of side effects and the
+    output remains a single self-contained file."""
+    strategy = None
+    decimation = None
+    threed = ""
+
+    def __init__(self, options, use_cycle, label):
+        "Set up the options, cycle list usage and label shared by all plots."
+        self.options = _OptionsDict(options)
+        self.label = label
+        if use_cycle:
+            self._plus = "+"
+        else:
+            self._plus = ""
+
+    def _choice(self, plan={}):
+        "Return the (strategy, decimation) used for writing with plan."
+        return plan.get(self, (self.strategy or "inline",
+                               self.decimation or 1))
+
+    def _data_tex(self, coordinates, strategy):
+        if strategy == "table":
+            return "table[{}] {}".format(coordinates.table_options(),
+                                         coordinates.table_str())
+        return "coordinates {}".format(coordinates)
+
+    def _addplot_tex(self, data):
+        if self.label is None:
+            label = ""
+        else:
+            label = "\addlegendentry{{{}}}".format(self.label)
+        return r"""\addplot{threed}{plus}[{options}] {data};
+        {label}""".format(
+            threed=self.threed,
+            plus=self._plus,
+            options=self.options,
+            data=data,
+            label=label)
+
+    def _tex(self, plan):
+        strategy, decimation = self._choice(plan)
+        return self._addplot_tex(self._data_tex(
+            self.coordinates.decimate(decimation), strategy))
+
+    def __str__(self):
+        return self._tex({})
+
+    def estimate_cost(self, strategy=None, decimation=None):
+        """Estimate the TeX resources (a cost.Cost) needed for this plot when
+        written with the given strategy and decimation (by default the ones
+        set on the plot). The length of the output is extrapolated from a few
+        evenly spread points, so this is cheap even for large plots."""
+        default_strategy, default_decimation = self._choice()
+        strategy = strategy or default_strategy
+        decimation = decimation or default_decimation
+        n_points = self.coordinates.count(decimation)
+
+        sample = self.coordinates.decimate(
+            max(1, len(self.coordinates)//_COST_SAMPLE_SIZE))
+        sample_tex = self._addplot_tex(self._data_tex(sample, strategy))
+        empty_tex = self._addplot_tex("")
+        chars_per_point = (float(len(sample_tex) - len(empty_tex)) /
+                           max(sample.count(1), 1))
+        n_chars = len(empty_tex) + int(chars_per_point*n_points)
+        if strategy == "table":
+            buf_size = max(len(line) for line in sample_tex.split("\n"))
+        else:
+            buf_size = (len(empty_tex.split("\n")[0]) +
+                        int(chars_per_point*n_points))
+        return cost.estimate(n_chars, buf_size, n_points)
+
 
 class SimpleTeX(PlotBase):
     "Class to include raw LaTeX commands inside an axis environment."
@@ -21,7 +115,7 @@ class SimpleTeX(PlotBase):
         return self.texcode
 
 
-class PlotCoordinates(PlotBase):
+class PlotCoordinates(_DataPlot):
     """Class describing a simple \addplots with inline coordinates."""
     def __init__(self, x, y, z=None,
                  options={}, use_cycle=True, label=None):
@@ -31,61 +125,24 @@ class PlotCoordinates(PlotBase):
         command. The options argument allows one to specify options to the
         addplots command. use_cycle allows for the addition of the + to
         \addplots and the label argument includes an \addlegend{label} command."""
-        self.options = _OptionsDict(options)
-        self.label = label
-        if use_cycle:
-            self._plus = "+"
-        else:
-            self._plus = ""
+        _DataPlot.__init__(self, options, use_cycle, label)
         if z is not None:
             self.threed = "3"
-        else:
-            self.threed = ""
 
         self.coordinates = Coordinates(x, y, z)
 
-    def __str__(self):
-        if self.label is None:
-            label = ""
-        else:
-            label = "\addlegendentry{{{}}}".format(self.label)
-        return r"""\addplot{threed}{plus}[{options}] coordinates {coordinates};
-        {label}""".format(
-            threed=self.threed,
-            plus=self._plus,
-            options=self.options,
-            coordinates=self.coordinates,
-            label=label)
 
-
-class PlotScatter(PlotBase):
+class PlotScatter(_DataPlot):
     def __init__(self, x, y, values=None,
                  options={}, use_cycle=True, label=None):
-        self.options = _OptionsDict(options)
+        _DataPlot.__init__(self, options, use_cycle, label)
         self.options["scatter"] = None
         self.options["scatter src"] = "explicit"
         self.options["only marks"] = None
-        self.label = label
-        if use_cycle:
-            self._plus = "+"
-        else:
-            self._plus = ""
         self.values = values
         
         self.coordinates = Coordinates(x, y, values=values)
 
-    def __str__(self):
-        if self.label is None:
-            label = ""
-        else:
-            label = "\addlegendentry{{{}}}".format(self.label)
-        return r"""\addplot{plus}[{options}] coordinates {coordinates};
-        {label}""".format(
-            plus=self._plus,
-            options=self.options,
-            coordinates=self.coordinates,
-            label=label)
-
 
 class Plot3DConst(PlotCoordinates):
     def __init__(self, x, ylevel, z, options={}, use_cycle=True, label=None):
@@ -109,4 +166,40 @@ class Plot3DConst(PlotCoordinates):
         return rx, [ylevel]*len(rx), rz
 
 
-
+class PlotErrorBars(_DataPlot):
+    """Class describing an \addplot with explicit error bars."""
+    def __init__(self, x, y, x_error=None, y_error=None,
+                 options={}, use_cycle=True, label=None):
+        """Initialize a new PlotErrorBars instance. x and y are sequences
+        describing the coordinates, x_error and y_error sequences (or single
+        values) describing symmetric errors in x and y direction. Error bars
+        are only drawn in the directions for which errors are given. The other
+        arguments are the same as for PlotCoordinates."""
+        _DataPlot.__init__(self, options, use_cycle, label)
+        if x_error is not None:
+            self.options["error bars/x dir"] = "both"
+            self.options["error bars/x explicit"] = None
+        if y_error is not None:
+            self.options["error bars/y dir"] = "both"
+            self.options["error bars/y explicit"] = None
+
+        self.coordinates = ErrorCoordinates(x, y, x_error, y_error)
+
+
+class PlotBand(_DataPlot):
+    """Class describing a filled band (e.g. a confidence interval) between a
+    lower and an upper curve drawn as a single closed path."""
+    def __init__(self, x, lower, upper,
+                 options={}, use_cycle=True, label=None):
+        """Initialize a new PlotBand instance. x, lower and upper are
+        sequences of equal length. By default the band is filled without
+        markers, which can be overridden by the options argument. The other
+        arguments are the same as for PlotCoordinates."""
+        band_options = {"fill": None, "no markers": None}
+        band_options.update(options)
+        _DataPlot.__init__(self, band_options, use_cycle, label)
+
+        self.coordinates = BandCoordinates(x, lower, upper)
+
+    def _data_tex(self, coordinates, strategy):
+        return _DataPlot._data_tex(self, coordinates, strategy) + " -- cycle"
@@ -1,7 +1,137 @@
 import pgfplots as pgf
 
+import warnings
+
+
+def check_budget():
+    # Too long lines are fixed by writing tables, not by decimation.
+    budget = pgf.Budget(buf_size=100)
+    ax = pgf.Axis()
+    plot = pgf.PlotCoordinates(range(1000), range(1000))
+    ax.add_plot(plot)
+    assert ax.estimate_cost().fits(pgf.Budget())
+    estimate, plan = ax.plan_budget(budget)
+    assert estimate.fits(budget)
+    assert plan[plot] == ("table", 1)
+    # Planning leaves the plot itself alone.
+    assert plot.strategy is None and plot.decimation is None
+
+    # Decimation cannot shorten a long raw TeX line.
+    ax.add_plot(pgf.SimpleTeX("%" + "x"*300))
+    estimate, plan = ax.plan_budget(budget)
+    assert not estimate.fits(budget)
+    assert plan[plot] == ("table", 1)
+
+    # Strategies and decimations set on a plot are kept.
+    plot.strategy = "inline"
+    assert ax.plan_budget(budget)[1][plot] == ("inline", 1)
+    plot.strategy = "table"
+    assert ax.plan_budget(pgf.Budget())[1][plot] == ("table", 1)
+
+    # Too many points are decimated, small plots are kept intact.
+    budget = pgf.Budget(main_memory=1000000)
+    ax = pgf.Axis()
+    large = pgf.PlotCoordinates(range(100000), range(100000))
+    small = pgf.PlotScatter(range(10), range(10), values=range(10))
+    ax.add_plot(large)
+    ax.add_plot(small)
+    assert not ax.estimate_cost().fits(budget)
+    estimate, plan = ax.plan_budget(budget)
+    assert estimate.fits(budget)
+    assert plan[large][1] > 1
+    assert plan[small][1] == 1
+
+    # The estimate extrapolated from a few points matches the actual output.
+    for plot in [large, small]:
+        for strategy in ["inline", "table"]:
+            plot.strategy = strategy
+            chars = len(str(plot))
+            estimate = plot.estimate_cost()
+            assert abs(estimate.main_memory - 40*len(plot.coordinates) -
+                       chars) < 0.05*chars
+            buf_size = max(len(l) for l in str(plot).split("\n"))
+            assert abs(estimate.buf_size - buf_size) <= 0.05*buf_size
+
+    # All axes of a figure are kept in memory at the same time.
+    fig = pgf.Figure()
+    for i in range(2):
+        ax = pgf.Axis()
+        ax.add_plot(pgf.PlotCoordinates(range(20000), range(20000)))
+        fig.add_axis(ax)
+    budget = pgf.Budget(main_memory=1500000, buf_size=1000000)
+    assert fig.axes[0].estimate_cost().fits(budget)
+    assert not fig.estimate_cost().fits(budget)
+    estimate, plan = fig.plan_budget(budget)
+    assert estimate.fits(budget)
+    assert all(d > 1 for _, d in plan.values())
+
+    # A budget below the fixed document overhead leaves the data alone, but
+    # warns when producing the output.
+    doc = pgf.Document(budget=pgf.Budget(compile_time=0.5))
+    fig = pgf.Figure()
+    doc.add_figure(fig)
+    ax = pgf.Axis()
+    fig.add_axis(ax)
+    ax.add_plot(pgf.PlotCoordinates(range(100), range(100)))
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        tex = str(doc)
+    assert "(99,99)" in tex
+    assert len(caught) == 1
+
+    # A tight compile time budget decimates the plots and warns about it.
+    doc.budget = pgf.Budget(compile_time=2.0)
+    plot = pgf.PlotCoordinates(range(20000), range(20000))
+    ax.add_plot(plot)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        tex = str(doc)
+    assert "(19999,19999)" not in tex
+    assert len(caught) == 1
+
+    # The decimation only applies to this output.
+    assert plot.strategy is None and plot.decimation is None
+    assert "(19999,19999)" in str(ax)
+    doc.budget = None
+    assert "(19999,19999)" in str(doc)
+
+
+def check_decimation():
+    # Single error values are broadcast, also after decimation.
+    plot = pgf.PlotErrorBars(range(1000), range(1000), y_error=0.5)
+    plot.decimation = 2
+    assert str(plot).count("+- (0,0.5)") == 500
+    plot.strategy = "table"
+    assert "998 998 0.5\n" in str(plot)
+
+    # Decimated bands keep their full extent.
+    plot = pgf.PlotBand(range(10), range(10), range(1, 11))
+    plot.decimation = 4
+    assert "coordinates {(0,1) (4,5) (8,9) (9,10) (9,9) (8,8)" in str(plot)
+    assert plot.coordinates.count(4) == 8
+    assert len(plot.coordinates.decimate(4)) == 8
+
+    # Mismatched lengths are rejected instead of silently misaligned.
+    for args in [([0, 1, 2, 3], [0, 1, 2], [1, 2, 3, 4]),
+                 ([0, 1, 2], [0, 1, 2], [1, 2, 3, 4])]:
+        try:
+            pgf.PlotBand(*args)
+        except ValueError:
+            pass
+        else:
+            assert False, "PlotBand accepted mismatched lengths"
+    try:
+        pgf.PlotErrorBars(range(4), range(4), y_error=[1, 2])
+    except ValueError:
+        pass
+    else:
+        assert False, "PlotErrorBars accepted mismatched lengths"
+
 
 if __name__ == '__main__':
+    check_budget()
+    check_decimation()
+
     doc = pgf.Document()
     fig = pgf.Figure(note="This is a note")
     doc.add_figure(fig)
@@ -41,4 +171,17 @@ if __name__ == '__main__':
                                options={"only marks": None})
     ax.add_plot(plot)
 
+    fig = pgf.Figure(note="Error bars and bands")
+    doc.add_figure(fig)
+    ax = pgf.Axis({"xlabel": "X-Axis",
+                   "ylabel": "Y-Axis"})
+    fig.add_axis(ax)
+    plot = pgf.PlotBand(range(10), [0.8*y for y in range(10)],
+                        [1.2*y for y in range(10)],
+                        options={"fill": "blue!20"})
+    ax.add_plot(plot)
+    plot = pgf.PlotErrorBars(range(10), range(10),
+                             y_error=[0.2*y for y in range(10)])
+    ax.add_plot(plot)
+
     print doc